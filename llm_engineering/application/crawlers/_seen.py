@@ -0,0 +1,53 @@
+import threading
+
+import xxhash
+from cachetools import LRUCache
+
+
+class SeenURLFilter:
+    """
+    In-process LRU filter of URLs that were already crawled.
+
+    URLs are stored as 64-bit xxh3 hashes, which keeps the memory footprint
+    small. The filter does not need cryptographic collision resistance, it
+    only saves database round-trips for URLs seen recently.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of URLs remembered, by default 100_000
+
+    Attributes
+    ----------
+    _cache : LRUCache[int, bool]
+        Least recently used cache of URL hashes.
+    """
+
+    def __init__(self, maxsize: int = 100_000) -> None:
+        self._cache: LRUCache[int, bool] = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def __contains__(self, url: str) -> bool:
+        key: int = xxhash.xxh3_64_intdigest(url.encode())
+        with self._lock:
+            return self._cache.get(key, False)
+
+    def add(self, url: str) -> None:
+        """
+        Remember a URL as crawled.
+
+        Parameters
+        ----------
+        url : str
+            The crawled URL.
+
+        Returns
+        -------
+        None
+        """
+        key: int = xxhash.xxh3_64_intdigest(url.encode())
+        with self._lock:
+            self._cache[key] = True
+
+
+seen_urls: SeenURLFilter = SeenURLFilter()
@@ -1,12 +1,64 @@
+import atexit
+import shutil
+import threading
 import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from queue import Queue
 from tempfile import mkdtemp
-from typing import Any
+from typing import Any, ClassVar, Iterator
 
+from bson.errors import InvalidDocument
+from loguru import logger
+from pymongo.errors import PyMongoError
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 from llm_engineering.domain.documents import NoSQLBaseDocument
+from ._seen import SeenURLFilter
+from ._seen import seen_urls as default_seen_urls
+
+
+# Resources that never contribute to the extracted text.
+BLOCKED_URL_PATTERNS: list[str] = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.woff*",
+    "*.ttf",
+    "*.mp4",
+    "*://*.google-analytics.com/*",
+    "*://*.doubleclick.net/*",
+    "*://*.googletagmanager.com/*",
+]
+
+
+def block_urls(driver: webdriver.Chrome) -> None:
+    """
+    Block the `BLOCKED_URL_PATTERNS` in the active tab of a driver.
+
+    CDP network settings only apply to the tab they are sent to, so this must
+    be called again for every tab that is opened.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Chrome WebDriver whose active tab is configured.
+
+    Returns
+    -------
+    None
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
 
 
 # Check if the current version of chromedriver exists and
@@ -18,14 +70,92 @@ class BaseCrawler(ABC):
     """
     Abstract base class for web crawlers.
 
+    Parameters
+    ----------
+    seen_urls : SeenURLFilter | None, optional
+        Filter of already crawled URLs, by default the process-wide filter
+    batch_size : int, optional
+        Number of buffered documents that triggers a bulk insert, by default
+        1_000. Buffers are also flushed once every link has been crawled, so
+        most crawl runs issue a single bulk insert per collection.
+
     Attributes
     ----------
     model : type[NoSQLBaseDocument]
         The document model class for storing crawled data.
+    seen_urls : SeenURLFilter
+        Filter of already crawled URLs.
+    batch_size : int
+        Number of buffered documents that triggers a bulk insert.
+    failed_links : set[str]
+        Links whose buffered documents could not be saved.
     """
 
     model: type[NoSQLBaseDocument]  # type: ignore
 
+    def __init__(
+        self, seen_urls: SeenURLFilter | None = None, batch_size: int = 1_000
+    ) -> None:
+        self.seen_urls = seen_urls if seen_urls is not None else default_seen_urls
+        self.batch_size = batch_size
+        self.failed_links: set[str] = set()
+        self._pending: list[tuple[str | None, NoSQLBaseDocument[Any]]] = []
+        self._pending_lock = threading.Lock()
+
+    @property
+    def supports_batch(self) -> bool:
+        """
+        Whether the crawler overrides `extract_batch` with a batched fetch.
+
+        Returns
+        -------
+        bool
+            True if links should be handed to `extract_batch` all at once,
+            False if they can be extracted one by one.
+        """
+        return type(self).extract_batch is not BaseCrawler.extract_batch
+
+    def is_seen(self, link: str) -> bool:
+        """
+        Check whether a link was already crawled.
+
+        The in-process filter is consulted first; the database is only
+        queried when the link is not in it.
+
+        Parameters
+        ----------
+        link : str
+            The URL to check.
+
+        Returns
+        -------
+        bool
+            True if the link was already crawled, False otherwise.
+        """
+        if link in self.seen_urls:
+            return True
+
+        if self.model.exists(link=link):
+            self.mark_seen(link)
+            return True
+
+        return False
+
+    def mark_seen(self, link: str) -> None:
+        """
+        Remember a link as crawled.
+
+        Parameters
+        ----------
+        link : str
+            The crawled URL.
+
+        Returns
+        -------
+        None
+        """
+        self.seen_urls.add(link)
+
     @abstractmethod
     def extract(self, link: str, **kwargs: dict[str, Any]) -> None:
         """
@@ -44,11 +174,129 @@ class BaseCrawler(ABC):
         """
         pass
 
+    def add_pending(
+        self, document: NoSQLBaseDocument[Any], link: str | None = None
+    ) -> None:
+        """
+        Buffer a document and flush the buffer once it reaches `batch_size`.
+
+        Parameters
+        ----------
+        document : NoSQLBaseDocument
+            The document to save.
+        link : str | None, optional
+            The crawled URL the document comes from, by default the `link`
+            field of the document
+
+        Returns
+        -------
+        None
+        """
+        if link is None:
+            link = getattr(document, "link", None)
+
+        with self._pending_lock:
+            self._pending.append((link, document))
+            is_full: bool = len(self._pending) >= self.batch_size
+
+        if is_full:
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Save every buffered document with a single bulk insert.
+
+        The links of the saved documents are marked as seen, the links of the
+        documents that could not be saved are added to `failed_links`.
+        Database errors, e.g. a document over the BSON size limit or a lost
+        connection, are logged and reported as a failed flush instead of being
+        raised.
+
+        Returns
+        -------
+        bool
+            True if the buffer was empty or saved successfully, False otherwise.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+
+        if not pending:
+            return True
+
+        links: set[str] = {link for link, _ in pending if link is not None}
+        documents: list[NoSQLBaseDocument[Any]] = [document for _, document in pending]
+        try:
+            saved: bool = self.model.bulk_insert(documents, fast_insert=False)
+        except (PyMongoError, InvalidDocument) as e:
+            logger.error(
+                f"Failed to save {len(documents)} document(s) of type "
+                f"{self.model.__name__}: {e!s}"
+            )
+            saved = False
+
+        with self._pending_lock:
+            if saved:
+                self.failed_links.difference_update(links)
+            else:
+                self.failed_links.update(links)
+        if saved:
+            for link in links:
+                self.mark_seen(link)
+
+        return saved
+
+    def extract_batch(
+        self, links: list[str], max_concurrency: int | None = None, **kwargs: Any
+    ) -> dict[str, bool]:
+        """
+        Extract data from several links handled by this crawler.
+
+        The default implementation calls `extract` once per link and flushes
+        the buffered documents at the end. Crawlers that can fetch many pages
+        concurrently should override it and honour `max_concurrency`.
+
+        Parameters
+        ----------
+        links : list[str]
+            The URLs to extract data from.
+        max_concurrency : int | None, optional
+            Maximum number of links fetched at the same time, by default None
+            to let the crawler decide. Ignored by the default implementation,
+            which fetches one link at a time.
+        **kwargs : Any
+            Additional keyword arguments forwarded to `extract`.
+
+        Returns
+        -------
+        dict[str, bool]
+            Mapping of each link to whether it was extracted successfully.
+        """
+        results: dict[str, bool] = {}
+        for link in links:
+            try:
+                self.extract(link=link, **kwargs)
+                results[link] = True
+            except Exception as e:
+                logger.error(f"An error occurred while crawling {link}: {e!s}")
+                results[link] = False
+
+        self.flush()
+        for link in links:
+            if link in self.failed_links:
+                results[link] = False
+
+        return results
+
 
 class BaseSeleniumCrawler(BaseCrawler, ABC):
     """
     Base class for Selenium-based web crawlers.
 
+    A single Chrome process, guarded by a lock of its own, is shared by all
+    instances of a crawler class and is only shut down when the interpreter
+    exits. Every extraction runs in its own tab (see `new_tab`) so that the
+    browser stays alive between calls.
+
     Parameters
     ----------
     scroll_limit : int, optional
@@ -59,11 +307,95 @@ class BaseSeleniumCrawler(BaseCrawler, ABC):
     scroll_limit : int
         Maximum number of scroll operations
     driver : webdriver.Chrome
-        Chrome WebDriver instance
+        Chrome WebDriver instance shared by the crawler class
+    block_resources : bool
+        Whether the driver tabs skip downloading images, fonts, videos and
+        analytics scripts matching `BLOCKED_URL_PATTERNS`
     """
 
+    block_resources: ClassVar[bool] = True
+    _driver: ClassVar[webdriver.Chrome | None] = None
+    _driver_lock: ClassVar[threading.RLock] = threading.RLock()
+    _temp_dirs: ClassVar[list[str]] = []
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each crawler class owns its browser, so it also owns its lock.
+        cls._driver_lock = threading.RLock()
+
     def __init__(self, scroll_limit: int = 5) -> None:
+        super().__init__()
+        self.scroll_limit = scroll_limit
+
+    @property
+    def driver(self) -> webdriver.Chrome:
+        """
+        Return the Chrome WebDriver shared by the crawler class.
+
+        Returns
+        -------
+        webdriver.Chrome
+            The pooled Chrome WebDriver instance.
+        """
+        return self.get_driver()
+
+    @classmethod
+    def get_driver(cls) -> webdriver.Chrome:
+        """
+        Lazily create the Chrome WebDriver shared by the crawler class.
+
+        Returns
+        -------
+        webdriver.Chrome
+            The pooled Chrome WebDriver instance.
+        """
+        driver: webdriver.Chrome | None = cls.__dict__.get("_driver")
+        if driver is not None:
+            return driver
+
+        with cls._driver_lock:
+            driver = cls.__dict__.get("_driver")
+            if driver is None:
+                driver = webdriver.Chrome(options=cls._build_options())
+                if cls.block_resources:
+                    block_urls(driver)
+                cls._driver = driver
+                atexit.register(cls.quit_driver)
+
+        return driver
+
+    @classmethod
+    def quit_driver(cls) -> None:
+        """
+        Quit the pooled Chrome WebDriver and remove its temporary directories.
+
+        Returns
+        -------
+        None
+        """
+        with cls._driver_lock:
+            driver: webdriver.Chrome | None = cls.__dict__.get("_driver")
+            if driver is not None:
+                driver.quit()
+                cls._driver = None
+
+            for temp_dir in cls.__dict__.get("_temp_dirs", []):
+                shutil.rmtree(temp_dir, ignore_errors=True)
+            cls._temp_dirs = []
+
+    @classmethod
+    def _build_options(cls) -> Options:
+        """
+        Build the Chrome options used to start the pooled driver.
+
+        Returns
+        -------
+        Options
+            Chrome driver options instance.
+        """
         options = webdriver.ChromeOptions()
+        temp_dirs: list[str] = [mkdtemp() for _ in range(3)]
+        cls._temp_dirs = temp_dirs
 
         options.add_argument("--no-sandbox")
         options.add_argument("--headless=new")
@@ -75,17 +407,17 @@ class BaseSeleniumCrawler(BaseCrawler, ABC):
         options.add_argument("--disable-background-networking")
         options.add_argument("--disable-certain-errors")
         options.add_argument("--ignore-certificate-errors")
-        options.add_argument(f"--user-data-dir={mkdtemp()}")
-        options.add_argument(f"--data-path={mkdtemp()}")
-        options.add_argument(f"--disk-cache-dir={mkdtemp()}")
+        options.add_argument(f"--user-data-dir={temp_dirs[0]}")
+        options.add_argument(f"--data-path={temp_dirs[1]}")
+        options.add_argument(f"--disk-cache-dir={temp_dirs[2]}")
         options.add_argument("--remote-debugging-port=9226")
 
-        options.set_extra_driver_options(options)
+        cls.set_extra_driver_options(options)
 
-        self.scroll_limit = scroll_limit
-        self.driver = webdriver.Chrome(options=options)
+        return options
 
-    def set_extra_driver_options(self, options: Options) -> None:
+    @classmethod
+    def set_extra_driver_options(cls, options: Options) -> None:
         """
         Set additional Chrome driver options.
 
@@ -100,6 +432,31 @@ class BaseSeleniumCrawler(BaseCrawler, ABC):
         """
         pass
 
+    @contextmanager
+    def new_tab(self) -> Iterator[str]:
+        """
+        Open a new browser tab for the duration of the context.
+
+        The tab is closed on exit and the driver switches back to the window
+        that was active before, keeping the browser process alive.
+
+        Yields
+        ------
+        str
+            The window handle of the new tab.
+        """
+        with self._driver_lock:
+            driver: webdriver.Chrome = self.driver
+            original_handle: str = driver.current_window_handle
+            driver.switch_to.new_window("tab")
+            if self.block_resources:
+                block_urls(driver)
+            try:
+                yield driver.current_window_handle
+            finally:
+                driver.close()
+                driver.switch_to.window(original_handle)
+
     def login(self) -> None:
         """
         Perform login operation.
@@ -110,30 +467,250 @@ class BaseSeleniumCrawler(BaseCrawler, ABC):
         """
         pass
 
-    def scroll_page(self) -> None:
+    def scroll_page(
+        self, poll_interval: float = 0.25, settle_timeout: float = 5
+    ) -> None:
         """
         Scroll the page to load dynamic content.
 
+        After each scroll the page is polled every `poll_interval` seconds
+        until its ready state, height and DOM mutation count stop changing,
+        instead of sleeping for a fixed time. Scrolling stops when a scroll
+        loads nothing new or `scroll_limit` is reached.
+
+        Parameters
+        ----------
+        poll_interval : float, optional
+            Seconds between two samples of the page state, by default 0.25
+        settle_timeout : float, optional
+            Maximum number of seconds to wait for the page to settle after a
+            scroll, by default 5
+
         Returns
         -------
         None
         """
-        current_scroll: int = 0
-        last_height: int = self.driver.execute_script(
-            "return document.body.scrollHeight"
+        self.driver.execute_script(
+            "if (window.__mutations === undefined) {"
+            "  window.__mutations = 0;"
+            "  new MutationObserver(() => window.__mutations++)"
+            "    .observe(document.body, {childList: true, subtree: true});"
+            "}"
         )
 
+        current_scroll: int = 0
+        last_state: list[Any] = self._get_page_state()
+
         while True:
             self.driver.execute_script(
                 "window.scrollTo(0, document.body.scrollHeight);"
             )
-            time.sleep(5)
-            new_height: int = self.driver.execute_script(
-                "return document.body.scrollHeight"
+            new_state: list[Any] = self._wait_until_settled(
+                poll_interval, settle_timeout
             )
-            if new_height == last_height or (
+            if new_state[1:] == last_state[1:] or (
                 self.scroll_limit and current_scroll >= self.scroll_limit
             ):
                 break
-            last_height = new_height
+            last_state = new_state
             current_scroll += 1
+
+    def _get_page_state(self) -> list[Any]:
+        """
+        Sample the ready state, height and DOM mutation count of the page.
+
+        Returns
+        -------
+        list[Any]
+            The `[readyState, scrollHeight, mutations]` triple.
+        """
+        return self.driver.execute_script(
+            "return [document.readyState, document.body.scrollHeight, "
+            "window.__mutations];"
+        )
+
+    def _wait_until_settled(
+        self, poll_interval: float, settle_timeout: float
+    ) -> list[Any]:
+        """
+        Poll the page until two consecutive samples of its state are equal.
+
+        Parameters
+        ----------
+        poll_interval : float
+            Seconds between two samples of the page state.
+        settle_timeout : float
+            Maximum number of seconds to wait.
+
+        Returns
+        -------
+        list[Any]
+            The last sampled page state.
+        """
+        deadline: float = time.monotonic() + settle_timeout
+        state: list[Any] = self._get_page_state()
+
+        while time.monotonic() < deadline:
+            time.sleep(poll_interval)
+            new_state: list[Any] = self._get_page_state()
+            if new_state == state and new_state[0] == "complete":
+                break
+            state = new_state
+
+        return state
+
+    def _wait_loaded(self, selector: str, timeout: float = 10) -> WebElement:
+        """
+        Wait until an element matching a CSS selector is present on the page.
+
+        Parameters
+        ----------
+        selector : str
+            CSS selector of the element to wait for.
+        timeout : float, optional
+            Maximum number of seconds to wait, by default 10
+
+        Returns
+        -------
+        WebElement
+            The first element matching the selector.
+
+        Raises
+        ------
+        TimeoutException
+            If no matching element appears within `timeout` seconds.
+        """
+        return WebDriverWait(self.driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
+
+
+class TabPool:
+    """
+    Pool of browser tabs used to load several pages of a driver in parallel.
+
+    Navigation is started in every tab without waiting for it to finish, so
+    the page loads overlap in the browser. WebDriver commands are still issued
+    one at a time because a session only has a single active window.
+
+    Parameters
+    ----------
+    driver : webdriver.Chrome
+        Chrome WebDriver instance owning the tabs.
+    size : int, optional
+        Number of tabs to open, by default 4
+    timeout : float, optional
+        Maximum number of seconds to wait for a page to load, by default 10
+    block_resources : bool, optional
+        Whether the tabs skip downloading the resources matching
+        `BLOCKED_URL_PATTERNS`, by default False
+
+    Attributes
+    ----------
+    handles : Queue[str]
+        Window handles of the tabs that are free to use.
+    """
+
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        size: int = 4,
+        timeout: float = 10,
+        block_resources: bool = False,
+    ) -> None:
+        self.driver = driver
+        self.timeout = timeout
+        self.handles: Queue[str] = Queue()
+
+        self._origin_handle: str = driver.current_window_handle
+        self._tabs: list[str] = []
+        known_handles: set[str] = set(driver.window_handles)
+        for _ in range(size):
+            driver.execute_script("window.open('about:blank');")
+        for handle in driver.window_handles:
+            if handle not in known_handles:
+                self._tabs.append(handle)
+                self.handles.put(handle)
+                if block_resources:
+                    driver.switch_to.window(handle)
+                    block_urls(driver)
+        driver.switch_to.window(self._origin_handle)
+
+    def __enter__(self) -> "TabPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def fetch(self, urls: list[str]) -> list[str]:
+        """
+        Load the given URLs in parallel tabs and return their page sources.
+
+        Parameters
+        ----------
+        urls : list[str]
+            The URLs to load. At most `size` URLs are loaded at the same time.
+
+        Returns
+        -------
+        list[str]
+            The page source of each URL, in the same order as `urls`.
+        """
+        page_sources: list[str] = []
+        for start in range(0, len(urls), len(self._tabs)):
+            batch: list[tuple[str, str]] = []
+            for url in urls[start : start + len(self._tabs)]:
+                handle: str = self.handles.get()
+                self.driver.switch_to.window(handle)
+                self.driver.execute_script(
+                    "document.__stale = true; window.location.href = arguments[0];",
+                    url,
+                )
+                batch.append((handle, url))
+
+            for handle, url in batch:
+                self.driver.switch_to.window(handle)
+                self._wait_until_loaded(url)
+                page_sources.append(self.driver.page_source)
+                self.handles.put(handle)
+
+        self.driver.switch_to.window(self._origin_handle)
+
+        return page_sources
+
+    def close(self) -> None:
+        """
+        Close every tab of the pool and switch back to the original window.
+
+        Returns
+        -------
+        None
+        """
+        for handle in self._tabs:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self._tabs = []
+        self.driver.switch_to.window(self._origin_handle)
+
+    def _wait_until_loaded(self, url: str) -> None:
+        """
+        Wait until the active tab has left its previous document and the new
+        one finished loading.
+
+        Parameters
+        ----------
+        url : str
+            The URL being loaded, used for logging.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            WebDriverWait(self.driver, self.timeout).until(
+                lambda driver: driver.execute_script(
+                    "return !document.__stale && document.readyState === 'complete';"
+                )
+            )
+        except TimeoutException:
+            logger.warning(f"Timed out waiting for page to load: {url}")
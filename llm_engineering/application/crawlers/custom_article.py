@@ -1,31 +1,41 @@
-from urllib.parse import urlparse
 from typing import Optional, Dict, Any
 
 from langchain_community.document_loaders import AsyncHtmlLoader
 from langchain_community.document_transformers.html2text import Html2TextTransformer
 from loguru import logger
 
+from llm_engineering.application.utils import get_netloc
 from llm_engineering.domain.documents import ArticleDocument
+from llm_engineering.domain.exceptions import LLMTwinException
 from .base import BaseCrawler
 
+# Html2TextTransformer is stateless, so one instance is shared by all crawls.
+_HTML2TEXT: Html2TextTransformer = Html2TextTransformer()
+
 
 class CustomArticleCrawler(BaseCrawler):
     """
     A crawler for extracting and storing custom articles.
 
+    Parameters
+    ----------
+    max_concurrency : int, optional
+        Maximum number of articles fetched at the same time, by default 32
+
     Attributes
     ----------
     model : ArticleDocument
         The document model for storing article data.
     """
 
-    model: ArticleDocument
+    model: type[ArticleDocument] = ArticleDocument
 
-    def __init__(self) -> None:
+    def __init__(self, max_concurrency: int = 32) -> None:
         """
         Initialize the CustomArticleCrawler.
         """
         super().__init__()
+        self.max_concurrency = max_concurrency
 
     def extract(self, link: str, **kwargs: Any) -> None:
         """
@@ -42,39 +52,112 @@ class CustomArticleCrawler(BaseCrawler):
         Returns
         -------
         None
+
+        Raises
+        ------
+        LLMTwinException
+            If the article could not be fetched or saved.
         """
-        old_model: Optional[ArticleDocument] = self.model.find(link=link)
-        if old_model is not None:
-            logger.info(f"Article already exists in the database: {link}")
-            return
+        if not self.extract_batch([link], **kwargs)[link]:
+            raise LLMTwinException(f"Failed to extract article: {link}")
 
-        logger.info(f"Extracting article: {link}")
-        loader: AsyncHtmlLoader = AsyncHtmlLoader([link])
-        docs = loader.load()
+    def extract_batch(
+        self, links: list[str], max_concurrency: int | None = None, **kwargs: Any
+    ) -> dict[str, bool]:
+        """
+        Fetch several articles concurrently and store them in the database.
 
-        html2text: Html2TextTransformer = Html2TextTransformer()
-        docs_transformed = html2text.transform_documents(docs)
-        doc_transformed = docs_transformed[0]
+        Links missing from the seen-URL filter are looked up with a single
+        query, the remaining pages are downloaded by one `AsyncHtmlLoader` and
+        all new documents are persisted with a single bulk insert.
 
-        content: Dict[str, Optional[str]] = {
-            "Title": doc_transformed.metadata.get("title"),
-            "Subtile": doc_transformed.metadata.get("description"),
-            "Author": doc_transformed.page_content,
-            "Language": doc_transformed.metadata.get("language"),
-        }
+        Parameters
+        ----------
+        links : list[str]
+            The URLs of the articles to extract.
+        max_concurrency : int | None, optional
+            Maximum number of articles fetched at the same time, by default the
+            `max_concurrency` of the crawler
+        **kwargs : Any
+            Additional keyword arguments.
+            Expected to contain 'user' with attributes 'id' and 'full_name'.
 
-        parsed_url = urlparse(link)
-        platform: str = parsed_url.netloc
+        Returns
+        -------
+        dict[str, bool]
+            Mapping of each link to whether it was extracted successfully.
+        """
+        existing_links: set[str] = {link for link in links if link in self.seen_urls}
+        unknown_links: list[str] = [
+            link for link in links if link not in existing_links
+        ]
+        if unknown_links:
+            # Only the links are fetched, the article bodies are not needed.
+            for document in self.model.get_collection().find(
+                {"link": {"$in": unknown_links}}, projection={"link": 1, "_id": 0}
+            ):
+                self.mark_seen(document["link"])
+                existing_links.add(document["link"])
+        for link in existing_links:
+            logger.info(f"Article already exists in the database: {link}")
 
-        user = kwargs.get("user")
-        instance: ArticleDocument = self.model(
-            author_id=user.id,  # type: ignore
-            author_full_name=user.full_name,  # type: ignore
-            content=content,
-            platform=platform,
-            link=link,
+        results: dict[str, bool] = {link: True for link in existing_links}
+        new_links: list[str] = [link for link in links if link not in existing_links]
+        if not new_links:
+            return results
+
+        logger.info(f"Extracting {len(new_links)} article(s).")
+        loader: AsyncHtmlLoader = AsyncHtmlLoader(
+            new_links,
+            default_parser="lxml",
+            requests_per_second=max_concurrency or self.max_concurrency,
+            ignore_load_errors=True,
         )
+        docs = loader.load()
 
-        instance.save()
+        # Failed downloads come back empty. They are checked before the
+        # transformation, which turns an empty page into blank lines.
+        fetched_links: list[str] = []
+        fetched_docs = []
+        for link, doc in zip(new_links, docs):
+            if doc.page_content.strip():
+                fetched_links.append(link)
+                fetched_docs.append(doc)
+            else:
+                logger.error(f"Failed to fetch article: {link}")
+                results[link] = False
 
-        logger.info(f"Custom article extracted and saved: {link}")
+        docs_transformed = _HTML2TEXT.transform_documents(fetched_docs)
+
+        user = kwargs.get("user")
+        instances: list[ArticleDocument] = []
+        for link, doc_transformed in zip(fetched_links, docs_transformed):
+            content: Dict[str, Optional[str]] = {
+                "Title": doc_transformed.metadata.get("title"),
+                "Subtile": doc_transformed.metadata.get("description"),
+                "Author": doc_transformed.page_content,
+                "Language": doc_transformed.metadata.get("language"),
+            }
+
+            platform: str = get_netloc(link)
+
+            instances.append(
+                self.model(
+                    author_id=user.id,  # type: ignore
+                    author_full_name=user.full_name,  # type: ignore
+                    content=content,
+                    platform=platform,
+                    link=link,
+                )
+            )
+
+        if instances:
+            saved: bool = self.model.bulk_insert(instances, fast_insert=False)
+            for instance in instances:
+                results[instance.link] = saved  # type: ignore
+                if saved:
+                    self.mark_seen(instance.link)  # type: ignore
+
+            logger.info(f"Custom articles extracted and saved: {len(instances)}")
+
+        return results
@@ -1,9 +1,14 @@
+import asyncio
 import re
+from typing import Any, Coroutine
 from urllib.parse import urlparse
 
 from loguru import logger
+from tqdm import tqdm
 
-from .base import BaseCrawler
+from llm_engineering.application.utils import get_netloc
+
+from .base import BaseCrawler, BaseSeleniumCrawler
 from .custom_article import CustomArticleCrawler
 from .github import GithubCrawler
 from .linkedin import LinkedInCrawler
@@ -18,6 +23,16 @@ class CrawlerDispatcher:
     ----------
     _crawlers : dict[str, type[BaseCrawler]]
         Dictionary mapping URL patterns to crawler classes.
+    _instances : dict[type[BaseCrawler], BaseCrawler]
+        Dictionary caching one crawler instance per crawler class.
+    _combined : re.Pattern[str] | None
+        All registered URL patterns fused into a single compiled pattern,
+        built lazily on the first lookup.
+    _by_group : dict[str, type[BaseCrawler]]
+        Dictionary mapping group names of the fused pattern to crawler classes.
+    _hosts : dict[str, type[BaseCrawler]]
+        Dictionary mapping registered domains, without "www.", to crawler
+        classes. Used to resolve most URLs without running a regex.
     """
 
     def __init__(self) -> None:
@@ -25,6 +40,10 @@ class CrawlerDispatcher:
         Initialize the CrawlerDispatcher with an empty crawler dictionary.
         """
         self._crawlers: dict[str, type[BaseCrawler]] = {}
+        self._instances: dict[type[BaseCrawler], BaseCrawler] = {}
+        self._combined: re.Pattern[str] | None = None
+        self._by_group: dict[str, type[BaseCrawler]] = {}
+        self._hosts: dict[str, type[BaseCrawler]] = {}
 
     @classmethod
     def build(cls) -> "CrawlerDispatcher":
@@ -89,7 +108,9 @@ class CrawlerDispatcher:
         parsed_domain: urlparse = urlparse(domain)  # type: ignore
         domain: str = parsed_domain.netloc  # type: ignore
 
-        self._crawlers[r"https://(www\.)?{}/*".format(re.escape(domain))] = crawler
+        self._crawlers[r"https://(?:www\.)?{}/*".format(re.escape(domain))] = crawler
+        self._hosts[domain.removeprefix("www.")] = crawler
+        self._combined = None
 
     def get_crawler(self, url: str) -> BaseCrawler:
         """
@@ -106,11 +127,213 @@ class CrawlerDispatcher:
             An instance of the appropriate crawler for the URL,
             or CustomArticleCrawler if no specific crawler is found.
         """
-        for pattern, crawler in self._crawlers.items():
-            if re.match(pattern, url):
-                return crawler()
-        else:
+        return self._get_instance(self._get_crawler_class(url))
+
+    def group_links(self, links: list[str]) -> list[tuple[BaseCrawler, list[str]]]:
+        """
+        Group links by the crawler that handles them.
+
+        Crawlers supporting batch extraction can then process all of their
+        links in a single call.
+
+        Parameters
+        ----------
+        links : list[str]
+            The URLs to group.
+
+        Returns
+        -------
+        list[tuple[BaseCrawler, list[str]]]
+            Pairs of crawler instance and the links it should extract.
+        """
+        groups: dict[type[BaseCrawler], list[str]] = {}
+        for link in links:
+            groups.setdefault(self._get_crawler_class(link), []).append(link)
+
+        return [
+            (self._get_instance(crawler), crawler_links)
+            for crawler, crawler_links in groups.items()
+        ]
+
+    async def dispatch_many(
+        self,
+        urls: list[str],
+        user: Any,
+        max_concurrency: int = 16,
+        max_per_host: int = 2,
+    ) -> dict[str, bool]:
+        """
+        Crawl many URLs concurrently with bounded concurrency.
+
+        Crawlers overriding `extract_batch` receive all of their URLs of a
+        host in one call, fetching at most `max_per_host` of them at once.
+        Every other URL is extracted in a worker thread, limited by a global
+        semaphore and by a per-host semaphore to stay polite. Duplicate URLs
+        are crawled once. The documents buffered by the crawlers are flushed
+        once all URLs are done, and the URLs whose documents could not be
+        saved are reported as failed.
+
+        Parameters
+        ----------
+        urls : list[str]
+            The URLs to crawl.
+        user : Any
+            The user the crawled documents belong to.
+        max_concurrency : int, optional
+            Maximum number of extractions running at once, by default 16
+        max_per_host : int, optional
+            Maximum number of extractions running at once against the same
+            host, by default 2
+
+        Returns
+        -------
+        dict[str, bool]
+            Mapping of each URL to whether it was crawled successfully.
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+        async def crawl_batch(
+            crawler: BaseCrawler, links: list[str]
+        ) -> dict[str, bool]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(
+                        crawler.extract_batch,
+                        links=links,
+                        max_concurrency=max_per_host,
+                        user=user,
+                    )
+                except Exception as e:
+                    logger.error(f"An error occurred while crawling: {e!s}")
+                    return {link: False for link in links}
+
+        async def crawl_link(crawler: BaseCrawler, link: str) -> dict[str, bool]:
+            host: str = get_netloc(link)
+            host_semaphore = host_semaphores.setdefault(
+                host, asyncio.Semaphore(max_per_host)
+            )
+            async with host_semaphore, semaphore:
+                try:
+                    await asyncio.to_thread(crawler.extract, link=link, user=user)
+                    return {link: True}
+                except Exception as e:
+                    logger.error(f"An error occurred while crawling {link}: {e!s}")
+                    return {link: False}
+
+        groups: list[tuple[BaseCrawler, list[str]]] = self.group_links(
+            list(dict.fromkeys(urls))
+        )
+        tasks: list[Coroutine[Any, Any, dict[str, bool]]] = []
+        for crawler, crawler_links in groups:
+            if crawler.supports_batch:
+                links_by_host: dict[str, list[str]] = {}
+                for link in crawler_links:
+                    links_by_host.setdefault(get_netloc(link), []).append(link)
+                tasks.extend(
+                    crawl_batch(crawler, host_links)
+                    for host_links in links_by_host.values()
+                )
+            else:
+                tasks.extend(crawl_link(crawler, link) for link in crawler_links)
+
+        results: dict[str, bool] = {}
+        for task in tqdm(asyncio.as_completed(tasks), total=len(tasks)):
+            results.update(await task)
+
+        for crawler, crawler_links in groups:
+            await asyncio.to_thread(crawler.flush)
+            for link in crawler_links:
+                if link in crawler.failed_links:
+                    results[link] = False
+
+        return results
+
+    async def close(self) -> None:
+        """
+        Shut down the browsers pooled by the Selenium crawlers in use.
+
+        Returns
+        -------
+        None
+        """
+        for crawler in self._instances:
+            if issubclass(crawler, BaseSeleniumCrawler):
+                await asyncio.to_thread(crawler.quit_driver)
+
+    def _get_instance(self, crawler: type[BaseCrawler]) -> BaseCrawler:
+        """
+        Get the cached instance of a crawler class, creating it if needed.
+
+        Parameters
+        ----------
+        crawler : type[BaseCrawler]
+            The crawler class to instantiate.
+
+        Returns
+        -------
+        BaseCrawler
+            The crawler instance reused across lookups.
+        """
+        if crawler not in self._instances:
+            self._instances[crawler] = crawler()
+
+        return self._instances[crawler]
+
+    def _get_crawler_class(self, url: str) -> type[BaseCrawler]:
+        """
+        Get the crawler class registered for a given URL.
+
+        Parameters
+        ----------
+        url : str
+            The URL to get a crawler class for.
+
+        Returns
+        -------
+        type[BaseCrawler]
+            The registered crawler class, or CustomArticleCrawler if no
+            specific crawler is found.
+        """
+        if url.startswith("https://"):
+            crawler: type[BaseCrawler] | None = self._hosts.get(
+                get_netloc(url).removeprefix("www.")
+            )
+            if crawler is not None:
+                return crawler
+
+        match: re.Match[str] | None = self._get_combined_pattern().match(url)
+        if match is None or match.lastgroup is None:
             logger.warning(
                 f"No crawler found for {url}. Defaulting to CustomArticleCrawler."
             )
-            return CustomArticleCrawler()
+            return CustomArticleCrawler
+
+        return self._by_group[match.lastgroup]
+
+    def _get_combined_pattern(self) -> re.Pattern[str]:
+        """
+        Get the registered URL patterns fused into one compiled pattern.
+
+        Each pattern is wrapped in a named group so that a single match tells
+        which crawler handles the URL.
+
+        Returns
+        -------
+        re.Pattern[str]
+            The compiled alternation of every registered pattern.
+        """
+        if self._combined is None:
+            self._by_group = {
+                f"c{index}": crawler
+                for index, crawler in enumerate(self._crawlers.values())
+            }
+            self._combined = re.compile(
+                "|".join(
+                    f"(?P<c{index}>{pattern})"
+                    for index, pattern in enumerate(self._crawlers)
+                )
+                or r"(?!)"
+            )
+
+        return self._combined
@@ -2,8 +2,10 @@ import os
 import shutil
 import subprocess
 import tempfile
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
 
+import xxhash
 from loguru import logger
 
 from llm_engineering.domain.documents import RepositoryDocument
@@ -20,12 +22,19 @@ class GithubCrawler(BaseCrawler):
         The document model class used for storing repository data.
     ignore : tuple[str, ...]
         File and directory extensions to ignore during crawling.
+    max_file_size : int
+        Files larger than this number of bytes are skipped.
+    max_workers : int
+        Number of threads used to read files concurrently.
     """
 
     model = RepositoryDocument
 
     def __init__(
-        self, ignore: tuple[str, ...] = (".git", ".toml", ".lock", ".png")
+        self,
+        ignore: tuple[str, ...] = (".git", ".toml", ".lock", ".png"),
+        max_file_size: int = 1_000_000,
+        max_workers: int = 8,
     ) -> None:
         """
         Initialize the GitHub crawler.
@@ -35,6 +44,12 @@ class GithubCrawler(BaseCrawler):
         ignore : tuple[str, ...]
             File and directory extensions to ignore during crawling.
             Default is (".git", ".toml", ".lock", ".png").
+        max_file_size : int
+            Files larger than this number of bytes are skipped.
+            Default is 1_000_000.
+        max_workers : int
+            Number of threads used to read files concurrently.
+            Default is 8.
 
         Returns
         -------
@@ -42,6 +57,8 @@ class GithubCrawler(BaseCrawler):
         """
         super().__init__()
         self.ignore = ignore
+        self.max_file_size = max_file_size
+        self.max_workers = max_workers
 
     def extract(self, link: str, **kwargs: dict[str, Any]) -> None:
         """
@@ -62,15 +79,15 @@ class GithubCrawler(BaseCrawler):
         Notes
         -----
         Creates a RepositoryDocument instance with the following structure:
-        - content: dict[str, str] mapping file paths to their contents
+        - content: dict mapping file paths to their contents, or to
+          {"dup_of": path} when an identical file was already stored
         - name: str, repository name
         - link: str, repository URL
         - platform: str, fixed as "GitHub"
         - author_id: Any, from user.id
         - author_full_name: str, from user.full_name
         """
-        old_model = self.model.find(link=link)
-        if old_model is not None:
+        if self.is_seen(link):
             logger.info(f"Repository already exists in the database: {link}")
             return
 
@@ -80,22 +97,32 @@ class GithubCrawler(BaseCrawler):
         local_temp: str = tempfile.mkdtemp()
 
         try:
-            os.chdir(local_temp)
-            subprocess.run(["git", "clone", link])
-            repo_path: str = os.path.join(local_temp, os.listdir(local_temp)[0])
-
-            tree: dict[str, str] = {}
-            for root, _, files in os.walk(repo_path):
-                dir = root.replace(repo_path, "").lsplit("/")  # type: ignore
-                if dir.startswith(self.ignore):
-                    continue
-
-                for file in files:
-                    if file.endswith(self.ignore):
+            subprocess.run(
+                ["git", "clone", "--depth=1", "--single-branch", link, local_temp],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            repo_path: str = local_temp
+
+            entries: list[os.DirEntry[str]] = list(self._scan_files(repo_path))
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                contents = executor.map(self._read_file, entries)
+
+                tree: dict[str, str | dict[str, str]] = {}
+                seen_hashes: dict[int, str] = {}
+                for entry, content in zip(entries, contents):
+                    if content is None:
                         continue
-                    file_path = os.path.join(dir, file)
-                    with open(os.path.join(root, file), "r", errors="ignore") as f:
-                        tree[file_path] = f.read().replace(" ", "")
+
+                    file_path: str = os.path.relpath(entry.path, repo_path)
+                    text, content_hash = content
+                    if content_hash in seen_hashes:
+                        tree[file_path] = {"dup_of": seen_hashes[content_hash]}
+                    else:
+                        seen_hashes[content_hash] = file_path
+                        tree[file_path] = text
 
             user = kwargs.get("user")
             instance = self.model(
@@ -106,10 +133,63 @@ class GithubCrawler(BaseCrawler):
                 author_id=user.id,  # type: ignore
                 author_full_name=user.full_name,  # type: ignore
             )
-            instance.save()
-        except Exception:
+            self.add_pending(instance)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to clone GitHub repository {link}: {e.stderr!s}")
             raise
         finally:
             shutil.rmtree(local_temp)
 
         logger.info(f"Finished extracting documents from GitHub repository: {link}")
+
+    def _scan_files(self, path: str) -> Iterator[os.DirEntry[str]]:
+        """
+        Recursively yield the files of a directory that should be crawled.
+
+        Parameters
+        ----------
+        path : str
+            The directory to scan.
+
+        Yields
+        ------
+        os.DirEntry[str]
+            Entries of files that are not ignored and not larger than
+            `max_file_size`.
+        """
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(self.ignore):
+                        yield from self._scan_files(entry.path)
+                elif (
+                    entry.is_file(follow_symlinks=False)
+                    and not entry.name.endswith(self.ignore)
+                    and entry.stat().st_size <= self.max_file_size
+                ):
+                    yield entry
+
+    @staticmethod
+    def _read_file(entry: os.DirEntry[str]) -> tuple[str, int] | None:
+        """
+        Read a file with all spaces removed and hash its content.
+
+        Parameters
+        ----------
+        entry : os.DirEntry[str]
+            The file to read.
+
+        Returns
+        -------
+        tuple[str, int] | None
+            The decoded file content and its xxh3 64-bit hash, or None if the
+            file is binary.
+        """
+        with open(entry.path, "rb") as f:
+            data: bytes = f.read()
+
+        if b"\0" in data[:8192]:
+            return None
+
+        data = data.translate(None, b" ")
+        return data.decode("utf-8", errors="ignore"), xxhash.xxh3_64_intdigest(data)
@@ -1,15 +1,22 @@
-import time
+import re
 from typing import Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 from loguru import logger
+from lxml import html
+from lxml.html import HtmlElement
 from selenium.webdriver.common.by import By
 
 from llm_engineering.domain.documents import PostDocument
 from llm_engineering.domain.exceptions import ImproperlyConfiguredException
 from llm_engineering.settings import settings
-from .base import BaseSeleniumCrawler
+from .base import BaseSeleniumCrawler, TabPool
+
+# Only the post texts and image buttons are parsed from the feed page.
+_POST_STRAINER: SoupStrainer = SoupStrainer(
+    ["div", "button"], attrs={"class": re.compile(r"update-components-(text|image)")}
+)
 
 
 class LinkedInCrawler(BaseSeleniumCrawler):
@@ -31,10 +38,11 @@ class LinkedInCrawler(BaseSeleniumCrawler):
     model = PostDocument
 
     def __init__(self, scroll_limit: int = 5, is_deprecated: bool = True) -> None:
-        super().__init__()
+        super().__init__(scroll_limit=scroll_limit)
         self._is_deprecated = is_deprecated
 
-    def set_extra_driver_options(self, options: Any) -> None:
+    @classmethod
+    def set_extra_driver_options(cls, options: Any) -> None:
         """Set additional Selenium driver options.
 
         Parameters
@@ -95,79 +103,93 @@ class LinkedInCrawler(BaseSeleniumCrawler):
                 "LinkedIn has updated its feed structure, the extract() method "
                 "is no longer supported."
             )
-        if self.model.link is not None:
-            old_model = self.model.find(link=link)
-            if old_model is not None:
-                logger.info(f"Post already exists in the database: {link}")
-                return
+        if self.is_seen(link):
+            logger.info(f"Post already exists in the database: {link}")
+            return
 
         logger.info(f"Extracting post: {link}")
-        self.login()
-
-        soup = self._get_page_content(link)
-        data: dict[str, Any] = {  # noqa: F841
-            "Name": self._scrape_section(soup, "hi", class_="text-heading-xlarge"),  # type: ignore
-            "About": self._scrape_section(soup, "div", class_="display-flex ph5 pv3"),  # type: ignore
-            "Main Page": self._scrape_section(soup, "div", {"id": "main-content"}),  # type: ignore
-            "Experience": self._scrape_experience(link),
-            "Education": self._scrape_education(link),
-        }
-        self.driver.get(link)
-        time.sleep(5)
-        button = self.driver.find_element(
-            By.CSS_SELECTOR,
-            ".app-aware-link.profile-creator-shared-content-view__footer-action",
-        )
-        button.click()
-
-        self.scroll_page()
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
-        post_elements = soup.find_all(
-            "div",
-            class_="update-components-text relative update-components-update-v2__commentary",
-        )
-        buttons = soup.find_all("button", class_="update-components-image__image-link")
-        post_images = self._extract_image_urls(buttons)
-        posts = self._extract_posts(post_elements, post_images)
-        logger.info(f"Found {len(posts)} posts for profile: {link}")
+        with self.new_tab():
+            self.login()
+
+            with TabPool(
+                self.driver, size=3, block_resources=self.block_resources
+            ) as pool:
+                tree, experience_tree, education_tree = (
+                    self._get_page_content(page_source)
+                    for page_source in pool.fetch(
+                        [
+                            link,
+                            link + "/details/experience/",
+                            link + "/details/education/",
+                        ]
+                    )
+                )
+            data: dict[str, Any] = {  # noqa: F841
+                "Name": self._scrape_section(
+                    tree,
+                    "//h1[contains(concat(' ', @class, ' '), ' text-heading-xlarge ')]",
+                ),
+                "About": self._scrape_section(
+                    tree, "//div[@class='display-flex ph5 pv3']"
+                ),
+                "Main Page": self._scrape_section(tree, "//div[@id='main-content']"),
+                "Experience": self._scrape_experience(experience_tree),
+                "Education": self._scrape_education(education_tree),
+            }
+            self.driver.get(link)
+            button = self._wait_loaded(
+                ".app-aware-link.profile-creator-shared-content-view__footer-action"
+            )
+            button.click()
 
-        self.driver.close()
+            self.scroll_page()
+            soup = BeautifulSoup(
+                self.driver.page_source, "lxml", parse_only=_POST_STRAINER
+            )
+            post_elements = soup.find_all(
+                "div",
+                class_="update-components-text relative update-components-update-v2__commentary",
+            )
+            buttons = soup.find_all(
+                "button", class_="update-components-image__image-link"
+            )
+            post_images = self._extract_image_urls(buttons)
+            posts = self._extract_posts(post_elements, post_images)
+            logger.info(f"Found {len(posts)} posts for profile: {link}")
 
         user = kwargs.get("user")
-        self.model.bulk_insert(
-            [
+        for post in posts.values():
+            self.add_pending(
                 PostDocument(
                     platform="LinkedIn",
                     content=post,
                     author_id=user.id,  # type: ignore
                     author_full_name=user.full_name,  # type: ignore
-                )
-                for post in posts
-            ]
-        )
+                ),
+                link=link,
+            )
         logger.info(f"Finnished extracting posts for profile: {link}")
 
-    def _scrape_section(
-        self, soup: BeautifulSoup, *args, **kwargs: dict[str, Any]
-    ) -> str:
+    def _scrape_section(self, tree: HtmlElement, xpath: str) -> str:
         """Scrape text content from a specific section of the page.
 
         Parameters
         ----------
-        soup : BeautifulSoup
+        tree : HtmlElement
             Parsed HTML content
-        *args : tuple
-            Positional arguments for BeautifulSoup find method
-        **kwargs : dict[str, Any]
-            Keyword arguments for BeautifulSoup find method
+        xpath : str
+            XPath expression selecting the section
 
         Returns
         -------
         str
             Extracted text content or empty string if section not found
         """
-        parent_div = soup.find(*args, **kwargs)
-        return parent_div.get_text(strip=True) if parent_div else ""
+        sections: list[HtmlElement] = tree.xpath(xpath)
+        if not sections:
+            return ""
+
+        return "".join(text.strip() for text in sections[0].itertext())
 
     def _extract_image_urls(self, buttons: list[Tag]) -> dict[str, str]:
         """Extract image URLs from post buttons.
@@ -192,22 +214,20 @@ class LinkedInCrawler(BaseSeleniumCrawler):
 
         return post_images
 
-    def _get_page_content(self, url: str) -> BeautifulSoup:
-        """Fetch and parse page content.
+    def _get_page_content(self, page_source: str) -> HtmlElement:
+        """Parse page content.
 
         Parameters
         ----------
-        url : str
-            URL to fetch content from
+        page_source : str
+            HTML source of a page loaded by the driver
 
         Returns
         -------
-        BeautifulSoup
+        HtmlElement
             Parsed HTML content
         """
-        self.driver.get(url)
-        time.sleep(5)
-        return BeautifulSoup(self.driver.page_source, "html.parser")
+        return html.fromstring(page_source)
 
     def _extract_posts(
         self, post_elements: list[Tag], post_images: dict[str, str]
@@ -236,40 +256,32 @@ class LinkedInCrawler(BaseSeleniumCrawler):
 
         return posts_data
 
-    def _scrape_experience(self, profile_url: str) -> str:
+    def _scrape_experience(self, tree: HtmlElement) -> str:
         """Scrape the Experience section of the LinkedIn profile.
 
         Parameters
         ----------
-        profile_url : str
-            Base URL of the LinkedIn profile
+        tree : HtmlElement
+            Parsed content of the profile's experience details page
 
         Returns
         -------
         str
             Extracted experience content or empty string if section not found
         """
-        self.driver.get(profile_url + "/details/experience/")
-        time.sleep(5)
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
-        experience_content = soup.find("section", {"id": "experience-section"})
-        return experience_content.get_text(strip=True) if experience_content else ""
+        return self._scrape_section(tree, "//section[@id='experience-section']")
 
-    def _scrape_education(self, profile_url: str) -> str:
+    def _scrape_education(self, tree: HtmlElement) -> str:
         """Scrape the Education section of the LinkedIn profile.
 
         Parameters
         ----------
-        profile_url : str
-            Base URL of the LinkedIn profile
+        tree : HtmlElement
+            Parsed content of the profile's education details page
 
         Returns
         -------
         str
             Extracted education content or empty string if section not found
         """
-        self.driver.get(profile_url + "/details/education/")
-        time.sleep(5)
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
-        education_content = soup.find("section", {"id": "education-section"})
-        return education_content.get_text(strip=True) if education_content else ""
+        return self._scrape_section(tree, "//section[@id='education-section']")
@@ -1,6 +1,7 @@
 from typing import Any
-from bs4 import BeautifulSoup
 from loguru import logger
+from lxml import html
+from lxml.html import HtmlElement
 
 from llm_engineering.domain.documents import ArticleDocument
 
@@ -19,7 +20,8 @@ class MediumCrawler(BaseSeleniumCrawler):
 
     model: type[ArticleDocument] = ArticleDocument
 
-    def set_extra_driver_options(self, options: object) -> None:
+    @classmethod
+    def set_extra_driver_options(cls, options: object) -> None:
         """
         Set additional Selenium driver options for Medium crawling.
 
@@ -36,7 +38,7 @@ class MediumCrawler(BaseSeleniumCrawler):
 
     def extract(self, link: str, **kwargs: dict[str, Any]) -> None:
         """
-        Extract article content from a Medium URL and save it to the database.
+        Extract article content from a Medium URL and buffer it for saving.
 
         Parameters
         ----------
@@ -50,29 +52,37 @@ class MediumCrawler(BaseSeleniumCrawler):
         -------
         None
         """
-        old_model = self.model.find(link=link)
-        if old_model is not None:
+        if self.is_seen(link):
             logger.info(f"Article already exists in the database: {link}")
 
             return
 
         logger.info(f"Starting scrapping Medium article: {link}")
 
-        self.driver.get(link)
-        self.scroll_page()
+        with self.new_tab():
+            self.driver.get(link)
+            self.scroll_page()
+            page_source: str = self.driver.page_source
 
-        soup: BeautifulSoup = BeautifulSoup(self.driver.page_source, "html.parser")
-        title: list[Any] = soup.find_all("h1", class_="pw-post-title")
-        subtitle: list[Any] = soup.find_all("h2", class_="pw-subtitle-paragraph")
+        tree: HtmlElement = html.fromstring(page_source)
+        title: list[HtmlElement] = tree.xpath(
+            "//h1[contains(concat(' ', @class, ' '), ' pw-post-title ')]"
+        )
+        subtitle: list[HtmlElement] = tree.xpath(
+            "//h2[contains(concat(' ', @class, ' '), ' pw-subtitle-paragraph ')]"
+        )
+
+        # Unlike BeautifulSoup's get_text(), text_content() keeps the text of
+        # scripts and styles, e.g. the inline JSON state of Medium pages.
+        for element in tree.xpath("//script|//style|//template|//noscript"):
+            element.drop_tree()
 
         data: dict[str, str | None] = {
-            "Title": title[0].string if title else None,
-            "Subtitle": subtitle[0].string if subtitle else None,
-            "Content": soup.get_text(),
+            "Title": title[0].text_content() if title else None,
+            "Subtitle": subtitle[0].text_content() if subtitle else None,
+            "Content": tree.text_content(),
         }
 
-        self.driver.close()
-
         user = kwargs["user"]
         instance: ArticleDocument = self.model(
             platform="medium",
@@ -81,6 +91,6 @@ class MediumCrawler(BaseSeleniumCrawler):
             author_id=user.id,  # type: ignore
             author_full_name=user.full_name,  # type: ignore
         )
-        instance.save()
+        self.add_pending(instance)
 
-        logger.info(f"Successfully scraped and saved article: {link}")
+        logger.info(f"Successfully scraped article: {link}")
@@ -1,3 +1,4 @@
+from llm_engineering.application.utils.get_netloc import get_netloc
 from llm_engineering.application.utils.split_user_full_name import split_user_full_name
 
-__all__ = ["split_user_full_name"]
+__all__ = ["get_netloc", "split_user_full_name"]
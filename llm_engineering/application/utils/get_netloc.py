@@ -0,0 +1,32 @@
+from urllib.parse import urlparse
+
+
+def get_netloc(url: str) -> str:
+    """Get the network location of a URL without running a full `urlparse`.
+
+    The netloc is sliced between the scheme separator and the first path,
+    query or fragment delimiter. URLs without a scheme fall back to `urlparse`
+    so that the result matches `urlparse(url).netloc`.
+
+    Parameters
+    ----------
+    url : str
+        The URL to get the network location of.
+
+    Returns
+    -------
+    str
+        The network location of the URL, e.g. "www.medium.com".
+    """
+    start: int = url.find("://")
+    if start < 0:
+        return urlparse(url).netloc
+
+    start += 3
+    end: int = len(url)
+    for delimiter in "/?#":
+        index: int = url.find(delimiter, start, end)
+        if index >= 0:
+            end = index
+
+    return url[start:end]
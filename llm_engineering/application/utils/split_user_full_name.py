@@ -1,7 +1,9 @@
+from functools import lru_cache
 from typing import Annotated, Any
 from llm_engineering.domain.exceptions import ImproperlyConfiguredException
 
 
+@lru_cache(maxsize=1024)
 def split_user_full_name(
     user: Any | None,
 ) -> tuple[Annotated[str, "first_name"], Annotated[str, "last_name"]]:
@@ -23,19 +25,13 @@ def split_user_full_name(
     Raises
     ------
     ImproperlyConfiguredException
-        If the user name is None or empty after splitting.
+        If the user name is None or empty.
     """
-    if user is None:  # type: ignore
+    if not user:
         raise ImproperlyConfiguredException("User full name is empty.")
 
-    name_tokens: list[str] = user.split(" ")  # type: ignore
-    if len(name_tokens) == 0:
-        raise ImproperlyConfiguredException("User full name is empty.")
-    elif len(name_tokens) == 1:
-        first_name: str = name_tokens[0]
-        last_name: str = name_tokens[0]
-    else:
-        first_name: str = " ".join(name_tokens[:-1])  # type: ignore
-        last_name: str = name_tokens[-1]  # type: ignore
+    first_name, separator, last_name = user.rpartition(" ")
+    if not separator:
+        return user, user
 
     return first_name, last_name
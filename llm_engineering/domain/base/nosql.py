@@ -1,17 +1,53 @@
 """The tutorial can be found at: https://pymongo.readthedocs.io/en/stable/tutorial.html#tutorial"""
 import uuid
 from abc import ABC
-from typing import Any, Generic, Type, TypeVar
+from functools import cache
+from itertools import islice
+from typing import Any, Generic, Iterator, Type, TypeVar
 
 from loguru import logger
-from pydantic import BaseModel, Field, UUID4
-from pymongo import errors
+from pydantic import BaseModel, ConfigDict, Field, UUID4, ValidationError
+from pymongo import IndexModel, ReturnDocument, WriteConcern, errors
+from pymongo.collection import Collection
+from pymongo.database import Database
 
 from llm_engineering.domain.exceptions import ImproperlyConfiguredException
-from llm_engineering.infra.db.mongo import connection
+from llm_engineering.infra.db.mongo import MongoDatabaseConnector
 from llm_engineering.settings import settings
 
-_database = connection.get_database(settings.DATABASE_NAME)
+
+@cache
+def _get_database() -> Database:
+    """
+    Get the application database, connecting to MongoDB on the first call.
+
+    Returns
+    -------
+    Database
+        The database handle, cached for the lifetime of the process.
+    """
+    return MongoDatabaseConnector().get_database(settings.DATABASE_NAME)
+
+
+@cache
+def _get_unacknowledged_collection(collection_name: str) -> Collection:
+    """
+    Get a collection handle using an unacknowledged (w=0) write concern.
+
+    Parameters
+    ----------
+    collection_name : str
+        Name of the collection.
+
+    Returns
+    -------
+    Collection
+        The collection handle, cached per collection name.
+    """
+    return _get_database().get_collection(
+        collection_name, write_concern=WriteConcern(w=0)
+    )
+
 
 # TypeVar T is a generic type variable that ensures type safety. It's bounded to NoSQLBaseDocument.
 # i.e. any type used in place of T must be a subclass of NoSQLBaseDocument.
@@ -28,6 +64,13 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
         Unique identifier for the document, auto-generated using UUID4.
     """
 
+    # Build the validator and serializer of every document class when it is
+    # defined, not when the first document is read or written. Documents are
+    # frozen so that their ID, and therefore their hash, cannot change.
+    model_config = ConfigDict(
+        defer_build=False, extra="ignore", frozen=True, populate_by_name=True
+    )
+
     id: UUID4 = Field(default_factory=uuid.uuid4)
 
     def __eq__(self, value: object) -> bool:
@@ -42,17 +85,20 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
         Returns
         -------
         bool
-            True if documents are equal, False otherwise.
+            True if both documents have the same type and ID, False otherwise.
         """
-        if not isinstance(value, self.__class__):
-            return False
+        if type(value) is not type(self):
+            return NotImplemented
 
-        return self.id == value.id
+        return self.id == value.id  # type: ignore
 
     def __hash__(self) -> int:
         """
         Generate hash value for the document.
 
+        Overrides the hash of frozen pydantic models, which hashes every field
+        and fails on unhashable ones such as `content`.
+
         Returns
         -------
         int
@@ -65,6 +111,8 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
         """
         Create document instance from MongoDB data.
 
+        The `_id` key of `data` is renamed to `id` in place.
+
         Parameters
         ----------
         data : dict
@@ -83,14 +131,17 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
         if not data:
             raise ValueError("Data cannot be empty.")
 
-        id = data.get("_id")
+        data["id"] = data.pop("_id", None)
 
-        return cls(**dict(data, id=id))
+        return cls.model_validate(data)
 
     def model_dump(self: T, **kwargs) -> dict[str, Any]:
         """
         Convert document to dictionary format.
 
+        Dumps in pydantic's JSON mode by default, so UUIDs are converted to
+        strings by pydantic-core instead of a Python loop.
+
         Parameters
         ----------
         **kwargs : dict
@@ -101,18 +152,17 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
         dict
             Document data in dictionary format.
         """
-        dict_: dict[str, Any] = super().model_dump(**kwargs)
-
-        for key, value in dict_.items():
-            if isinstance(value, uuid.UUID):
-                dict_[key] = str(value)
+        kwargs.setdefault("mode", "json")
 
-        return dict_
+        return super().model_dump(**kwargs)
 
     def to_mongo(self: T, **kwargs) -> dict:  # type: ignore
         """
         Convert document to MongoDB format.
 
+        Without arguments, the document is serialized by calling pydantic-core
+        directly, skipping the `model_dump` argument handling.
+
         Parameters
         ----------
         **kwargs : dict
@@ -123,18 +173,18 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
         dict
             Document data in MongoDB format.
         """
-        exclude_unset = kwargs.pop("exclude_unset", False)
-        by_alias = kwargs.pop("by_alias", False)
-
-        parsed: dict[str, Any] = self.model_dump(
-            exclude_unset=exclude_unset, by_alias=by_alias, **kwargs
-        )
-        if "_id" not in parsed and "id" in parsed:
-            parsed["_id"] = str(parsed.pop("id"))
-
-        for key, value in parsed.items():
-            if isinstance(value, uuid.UUID):
-                parsed[key] = str(value)
+        parsed: dict[str, Any]
+        if not kwargs:
+            parsed = self.__pydantic_serializer__.to_python(self, mode="json")
+        else:
+            exclude_unset = kwargs.pop("exclude_unset", False)
+            by_alias = kwargs.pop("by_alias", False)
+
+            parsed = self.model_dump(
+                exclude_unset=exclude_unset, by_alias=by_alias, **kwargs
+            )
+        if "id" in parsed:
+            parsed["_id"] = parsed.pop("id")
 
         return parsed
 
@@ -152,7 +202,7 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
         T | None
             Saved document instance or None if save failed.
         """
-        collection = _database[self.get_collection_name()]
+        collection = self.get_collection()
 
         try:
             collection.insert_one(self.to_mongo(**kwags))
@@ -169,6 +219,13 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
         """
         Get existing document or create new one.
 
+        When a unique index of the collection covers exactly the filter
+        fields, the document is inserted first and only looked up when the
+        insert hits a duplicate key, so creating a new document takes a single
+        round trip. Otherwise the lookup and the creation are a single atomic
+        upsert, so concurrent callers cannot create duplicates. A filter that
+        does not describe a complete document can only be looked up.
+
         Parameters
         ----------
         **filter_options : dict
@@ -181,19 +238,43 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
 
         Raises
         ------
+        ValidationError
+            If no document matches and the filter cannot create one.
         errors.OperationFailure
             If database operation fails.
         """
-        collection = _database[cls.get_collection_name()]
+        collection = cls.get_collection()
         try:
-            instance = collection.find_one(filter_options)
-            if instance:
-                return cls.from_mongo(instance)
+            try:
+                new_instance: T = cls(**filter_options)
+            except ValidationError:
+                instance = collection.find_one(filter_options)
+                if instance is None:
+                    raise
 
-            new_instance = cls(**filter_options)
-            new_instance = new_instance.save()  # type: ignore
+                return cls.from_mongo(instance)
 
-            return new_instance
+            if frozenset(filter_options) in cls._get_unique_keys():
+                try:
+                    collection.insert_one(new_instance.to_mongo())
+
+                    return new_instance
+                except errors.DuplicateKeyError:
+                    instance = collection.find_one(filter_options)
+            else:
+                new_document: dict[str, Any] = {
+                    key: value
+                    for key, value in new_instance.to_mongo().items()
+                    if key not in filter_options
+                }
+                instance = collection.find_one_and_update(
+                    filter_options,
+                    {"$setOnInsert": new_document},
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                )
+
+            return cls.from_mongo(instance)
 
         except errors.OperationFailure:
             logger.exception(
@@ -202,14 +283,29 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
             raise
 
     @classmethod
-    def bulk_insert(cls: Type[T], documents: list[T], **kwargs) -> bool:
+    def bulk_insert(
+        cls: Type[T],
+        documents: list[T],
+        batch_size: int = 1_000,
+        fast_insert: bool = True,
+        **kwargs,
+    ) -> bool:
         """
         Insert multiple documents at once.
 
+        Documents are sent in chunks of `batch_size` with unordered inserts, so
+        a failing document does not stop the rest of the chunk.
+
         Parameters
         ----------
         documents : list[T]
             List of documents to insert.
+        batch_size : int, optional
+            Number of documents sent per `insert_many` call, by default 1_000
+        fast_insert : bool, optional
+            Whether to use an unacknowledged (w=0) write concern, by default
+            True. Write errors are not reported in that mode; pass False when
+            the caller needs to know whether every document was stored.
         **kwargs : dict
             Additional arguments for insertion.
 
@@ -218,16 +314,50 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
         bool
             True if successful, False otherwise.
         """
-        collection = _database[cls.get_collection_name()]
+        collection = cls.get_collection()
+        if fast_insert:
+            collection = _get_unacknowledged_collection(collection.name)
 
+        mongo_documents = (doc.to_mongo(**kwargs) for doc in documents)
         try:
-            collection.insert_many(doc.to_mongo(**kwargs) for doc in documents)
+            while chunk := list(islice(mongo_documents, batch_size)):
+                collection.insert_many(chunk, ordered=False)
 
             return True
         except (errors.BulkWriteError, errors.WriteError):
             logger.error(f"Failed to bulk insert documents of type {cls.__name__}.")
             return False
 
+    @classmethod
+    def exists(cls: Type[T], **filter_options) -> bool:
+        """
+        Check whether a document matching filter criteria exists.
+
+        Only the `_id` field is fetched, so the document is neither transferred
+        nor validated.
+
+        Parameters
+        ----------
+        **filter_options : dict
+            Filter criteria for document lookup.
+
+        Returns
+        -------
+        bool
+            True if a matching document exists, False otherwise.
+        """
+        collection = cls.get_collection()
+        try:
+            return (
+                collection.find_one(filter_options, projection={"_id": 1}) is not None
+            )
+
+        except errors.OperationFailure:
+            logger.exception(
+                f"Failed to retrieve document with filter options {filter_options}."
+            )
+            return False
+
     @classmethod
     def find(cls: Type[T], **filter_options) -> T | None:
         """
@@ -243,7 +373,7 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
         T | None
             Matching document instance or None if not found.
         """
-        collection = _database[cls.get_collection_name()]
+        collection = cls.get_collection()
         try:
             instance = collection.find_one(filter_options)
             if instance:
@@ -258,9 +388,37 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
             return None
 
     @classmethod
-    def bulk_find(cls: Type[T], **filter_options) -> list[T]:
+    def bulk_find(cls: Type[T], **filter_options) -> Iterator[T]:
         """
-        Find multiple documents matching filter criteria.
+        Lazily find multiple documents matching filter criteria.
+
+        Documents are fetched from MongoDB in batches of 500 and validated one
+        at a time as the caller iterates.
+
+        Parameters
+        ----------
+        **filter_options : dict
+            Filter criteria for documents lookup.
+
+        Yields
+        ------
+        T
+            Matching document instances.
+        """
+        collection = cls.get_collection()
+        try:
+            for instance in collection.find(filter_options, batch_size=500):
+                yield cls.from_mongo(instance)
+
+        except errors.OperationFailure:
+            logger.exception(
+                f"Failed to retrieve document with filter options {filter_options}."
+            )
+
+    @classmethod
+    def bulk_find_list(cls: Type[T], **filter_options) -> list[T]:
+        """
+        Find multiple documents matching filter criteria as a list.
 
         Parameters
         ----------
@@ -272,21 +430,66 @@ class NoSQLBaseDocument(BaseModel, ABC, Generic[T]):
         list[T]
             List of matching document instances.
         """
-        collection = _database[cls.get_collection_name()]
-        try:
-            instances = collection.find(filter_options)
-            return [
-                document
-                for instance in instances
-                if (document := cls.from_mongo(instance)) is not None
-            ]
+        return list(cls.bulk_find(**filter_options))
+
+    @classmethod
+    @cache
+    def get_collection(cls: Type[T]) -> Collection:
+        """
+        Get the MongoDB collection of the document.
+
+        The collection is resolved, and the indexes declared in
+        `Settings.indexes` are created, only the first time it is requested
+        for a document class; later calls return the cached handle.
+
+        Returns
+        -------
+        Collection
+            The MongoDB collection.
+        """
+        collection_name: str = cls.get_collection_name()
+        collection: Collection = _get_database()[collection_name]
+
+        indexes: list[IndexModel] = getattr(cls.Settings, "indexes", [])
+        if indexes:
+            try:
+                collection.create_indexes(indexes)
+            except errors.OperationFailure:
+                logger.exception(
+                    f"Failed to create indexes for collection {collection_name}."
+                )
 
+        return collection
+
+    @classmethod
+    @cache
+    def _get_unique_keys(cls: Type[T]) -> list[frozenset[str]]:
+        """
+        Get the sets of fields covered by a unique index of the collection.
+
+        The indexes are read from the server, so an index declared in
+        `Settings.indexes` that failed to be created is not reported. Partial
+        indexes are left out because they do not cover every document.
+
+        Returns
+        -------
+        list[frozenset[str]]
+            The fields of each unique index, cached per document class.
+        """
+        try:
+            indexes: dict[str, Any] = cls.get_collection().index_information()
         except errors.OperationFailure:
             logger.exception(
-                f"Failed to retrieve document with filter options {filter_options}."
+                f"Failed to list the indexes of collection {cls.get_collection_name()}."
             )
             return []
 
+        return [
+            frozenset(field for field, _ in index["key"])
+            for index in indexes.values()
+            if index.get("unique") and "partialFilterExpression" not in index
+        ]
+
     @classmethod
     def get_collection_name(cls: Type[T]) -> str:
         """
@@ -2,6 +2,7 @@ from abc import ABC
 from typing import Any
 
 from pydantic import UUID4, Field
+from pymongo import ASCENDING, IndexModel
 
 from .base import NoSQLBaseDocument
 from .types import DataCategory
@@ -24,6 +25,11 @@ class UserDocument(NoSQLBaseDocument):  # type: ignore
 
     class Settings:
         name: str = "users"
+        indexes = [
+            IndexModel(
+                [("first_name", ASCENDING), ("last_name", ASCENDING)], unique=True
+            )
+        ]
 
     @property
     def full_name(self) -> str:
@@ -77,6 +83,7 @@ class RepositoryDocument(Document):
 
     class Settings:
         name = DataCategory.REPOSITORIES
+        indexes = [IndexModel("link", unique=True), IndexModel("authod_id")]
 
 
 class PostDocument(Document):
@@ -96,6 +103,7 @@ class PostDocument(Document):
 
     class Settings:
         name = DataCategory.POSTS
+        indexes = [IndexModel("authod_id")]
 
 
 class ArticleDocument(Document):
@@ -112,3 +120,11 @@ class ArticleDocument(Document):
 
     class Settings:
         name = DataCategory.ARTICLES
+        indexes = [
+            IndexModel(
+                "link",
+                unique=True,
+                partialFilterExpression={"link": {"$type": "string"}},
+            ),
+            IndexModel("authod_id"),
+        ]
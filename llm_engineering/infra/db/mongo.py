@@ -49,7 +49,13 @@ class MongoDatabaseConnector:
         """
         if cls._instance is None:
             try:
-                cls._instance = MongoClient(settings.DATABASE_HOST)
+                cls._instance = MongoClient(
+                    settings.DATABASE_HOST,
+                    maxPoolSize=settings.MONGO_MAX_POOL,
+                    compressors="zlib",
+                    retryWrites=True,
+                    serverSelectionTimeoutMS=5_000,
+                )
                 cls._instance.admin.command("ping")  # Verifies the connection
                 logger.info(
                     f"Connected to MongoDB URI successfully: {settings.DATABASE_HOST}"
@@ -59,6 +65,3 @@ class MongoDatabaseConnector:
                 raise
 
         return cls._instance
-
-
-connection: MongoClient = MongoDatabaseConnector()
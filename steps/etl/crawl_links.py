@@ -1,27 +1,33 @@
-from typing import Any
-from urllib.parse import urlparse
+import asyncio
+from collections import defaultdict
 
 from loguru import logger
-from tqdm import tqdm
 from typing_extensions import Annotated
 from zenml import get_step_context, step
 
 from llm_engineering.application.crawlers.dispatcher import CrawlerDispatcher
+from llm_engineering.application.utils import get_netloc
 from llm_engineering.domain.documents import UserDocument
 
 
 @step
 def crawl_links(
-    user: UserDocument, links: list[str]
+    user: UserDocument, links: list[str], max_workers: int = 8
 ) -> Annotated[list[str], "crawled_links"]:
     """Crawl a list of links and extract information using appropriate crawlers.
 
+    Links are crawled concurrently by `CrawlerDispatcher.dispatch_many`, which
+    also flushes the documents buffered by the crawlers at the end. Duplicate
+    links are crawled and counted once.
+
     Parameters
     ----------
     user : UserDocument
         The user document containing user information.
     links : list[str]
         A list of URLs to crawl.
+    max_workers : int, optional
+        Maximum number of crawls running at the same time, by default 8
 
     Returns
     -------
@@ -35,80 +41,63 @@ def crawl_links(
         .register_github()
     )
 
-    logger.info(f"Starting to crawl {len(links)} link(s).")
+    unique_links: list[str] = list(dict.fromkeys(links))
+    logger.info(f"Starting to crawl {len(unique_links)} link(s).")
+
+    results: dict[str, bool] = asyncio.run(
+        _crawl_links(dispatcher, unique_links, user, max_workers)
+    )
 
-    metadata: dict[str, dict[str, Any]] = {}
+    metadata: defaultdict[str, dict[str, int]] = defaultdict(
+        lambda: {"successful": 0, "total": 0}
+    )
     successfull_crawls: int = 0
-    for link in tqdm(links):
-        successfull_crawl, crawled_domain = _crawl_link(dispatcher, link, user)
+    for link, successfull_crawl in results.items():
         successfull_crawls += successfull_crawl
 
-        metadata = _add_to_metadata(metadata, crawled_domain, successfull_crawl)
+        domain_metadata: dict[str, int] = metadata[get_netloc(link)]
+        domain_metadata["successful"] += successfull_crawl
+        domain_metadata["total"] += 1
 
     step_context = get_step_context()
-    step_context.add_output_metadata(output_name="crawled_links", metadata=metadata)
+    step_context.add_output_metadata(
+        output_name="crawled_links", metadata=dict(metadata)
+    )
 
-    logger.info(f"Successfully crawled {successfull_crawls} / {len(links)} links.")
+    logger.info(
+        f"Successfully crawled {successfull_crawls} / {len(unique_links)} links."
+    )
 
     return links
 
 
-def _crawl_link(
-    dispatcher: CrawlerDispatcher, link: str, user: UserDocument
-) -> tuple[bool, str]:
-    """Attempt to crawl a single link using the appropriate crawler.
+async def _crawl_links(
+    dispatcher: CrawlerDispatcher,
+    links: list[str],
+    user: UserDocument,
+    max_concurrency: int,
+) -> dict[str, bool]:
+    """Crawl the links with the dispatcher and shut down its browsers.
 
     Parameters
     ----------
     dispatcher : CrawlerDispatcher
-        The dispatcher instance that provides appropriate crawlers.
-    link : str
-        The URL to crawl.
+        The dispatcher routing the links to their crawlers.
+    links : list[str]
+        The URLs to crawl.
     user : UserDocument
         The user document containing user information.
+    max_concurrency : int
+        Maximum number of crawls running at the same time.
 
     Returns
     -------
-    tuple[bool, str]
-        A tuple containing (success_status, domain_name).
+    dict[str, bool]
+        Mapping of each link to its success status.
     """
-    crawler = dispatcher.get_crawler(link)
-    crawler_domain: str = urlparse(link).netloc
-
     try:
-        crawler.extract(link=link, user=user)
-
-        return (True, crawler_domain)
-    except Exception as e:
-        logger.error(f"An error occurred while crowling: {e!s}")
-
-        return (False, crawler_domain)
-
-
-def _add_to_metadata(
-    metadata: dict[str, dict[str, Any]], domain: str, successful_crawl: bool
-) -> dict[str, dict[str, Any]]:
-    """Update metadata dictionary with crawling results for a domain.
-
-    Parameters
-    ----------
-    metadata : dict[str, dict]
-        The metadata dictionary to update.
-    domain : str
-        The domain name of the crawled URL.
-    successful_crawl : bool
-        Whether the crawl was successful.
-
-    Returns
-    -------
-    dict[str, dict]
-        The updated metadata dictionary.
-    """
-    if domain not in metadata:
-        metadata[domain] = {}
-    metadata[domain]["successful"] = (
-        metadata.get(domain, {}).get("successful", 0) + successful_crawl
-    )
-    metadata[domain]["total"] = metadata.get(domain, {}).get("total", 0) + 1
-
-    return metadata
+        return await dispatcher.dispatch_many(
+            links, user=user, max_concurrency=max_concurrency
+        )
+    finally:
+        await dispatcher.close()
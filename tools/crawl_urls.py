@@ -0,0 +1,74 @@
+import asyncio
+from pathlib import Path
+
+import click
+from loguru import logger
+
+from llm_engineering.application import utils
+from llm_engineering.application.crawlers.dispatcher import CrawlerDispatcher
+from llm_engineering.domain.documents import UserDocument
+
+
+@click.command(
+    help="""
+Crawl every URL listed in a text file outside of a ZenML pipeline.
+
+The file contains one URL per line. Empty lines and lines starting
+with '#' are ignored.
+
+Examples:
+
+  \b
+  # Crawl the URLs of urls.txt for a user
+  python -m tools.crawl_urls urls.txt --user-full-name "Paul Iusztin"
+
+"""
+)
+@click.argument(
+    "urls_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--user-full-name",
+    required=True,
+    help="Full name of the user the crawled documents belong to.",
+)
+@click.option(
+    "--max-concurrency",
+    default=16,
+    show_default=True,
+    help="Maximum number of URLs crawled at the same time.",
+)
+def main(urls_file: Path, user_full_name: str, max_concurrency: int) -> None:
+    urls: list[str] = [
+        line.strip()
+        for line in urls_file.read_text().splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    ]
+
+    first_name, last_name = utils.split_user_full_name(user_full_name)
+    user = UserDocument.get_or_create(first_name=first_name, last_name=last_name)
+
+    results: dict[str, bool] = asyncio.run(_crawl(urls, user, max_concurrency))
+    logger.info(f"Successfully crawled {sum(results.values())} / {len(results)} links.")
+
+
+async def _crawl(
+    urls: list[str], user: UserDocument, max_concurrency: int
+) -> dict[str, bool]:
+    dispatcher: CrawlerDispatcher = (
+        CrawlerDispatcher.build()
+        .register_linkedin()
+        .register_medium()
+        .register_github()
+    )
+    try:
+        return await dispatcher.dispatch_many(
+            urls, user=user, max_concurrency=max_concurrency
+        )
+    finally:
+        await dispatcher.close()
+
+
+if __name__ == "__main__":
+    main()